@@ -1,19 +1,32 @@
 #!/usr/bin/env python3
+import argparse
+import ctypes
+import functools
 import logging
+import os
 import re
 import shutil
+import signal
 import subprocess
 import sys
+import threading
+from contextlib import closing
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
-
-try:
-    from colorama import Fore, Style, init as colorama_init
-    colorama_init(autoreset=True)
-    COLOR_ENABLED = True
-except ImportError:
-    # Create dummy color classes and functions if colorama is not installed
-    COLOR_ENABLED = False
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+# Colors are only useful on a terminal, so skip importing colorama entirely when
+# output is piped or NO_COLOR is set (https://no-color.org)
+COLOR_ENABLED = False
+if sys.stdout.isatty() and not os.environ.get("NO_COLOR"):
+    try:
+        from colorama import Fore, Style, init as colorama_init
+        colorama_init(autoreset=True)
+        COLOR_ENABLED = True
+    except ImportError:
+        pass
+
+if not COLOR_ENABLED:
+    # Create dummy color classes and functions if colorama is not used
     class DummyColor:
         def __getattr__(self, name: str) -> str:
             return ""
@@ -29,20 +42,29 @@ logging.basicConfig(
 
 # -------------------- Constants --------------------
 
-# --- Core System Commands ---
-REQUIRED_COMMANDS: Set[str] = {"lspci", "lsmod"}
+# --- Core System Files ---
+# No external utility is required: GPU detection reads PCI IDs in-process and
+# only falls back to the GPU detection commands below when that is impossible
+PROC_MODULES: Path = Path("/proc/modules")  # Loaded kernel modules, as read by lsmod
+REQUIRED_FILES: Set[Path] = {PROC_MODULES}
 
 # --- GPU Hardware Detection ---
-GPU_DETECTION_COMMANDS: List[List[str]] = [
-    ["lspci"],
-    ["lshw", "-C", "display"],
-    ["glxinfo", "-B"],
-]
+GPU_DETECTION_COMMANDS: Tuple[Tuple[str, ...], ...] = (
+    ("lspci",),
+    ("lshw", "-C", "display"),
+)
+# glxinfo initializes GL/X11 and is by far the slowest, so it only runs with --thorough
+THOROUGH_GPU_DETECTION_COMMANDS: Tuple[Tuple[str, ...], ...] = (
+    ("glxinfo", "-B"),
+)
+# Utilities whose output is trusted on its own once it reports any GPU vendor
+AUTHORITATIVE_GPU_DETECTION_COMMANDS: Set[str] = {"lspci"}
 
 # --- Kernel Module Definitions ---
 NVIDIA_PROPRIETARY_MODULES: Set[str] = {"nvidia", "nvidia_drm", "nvidia_modeset", "nvidia_uvm"}
 NVIDIA_OPEN_MODULES: Set[str] = {"nouveau"}
 INTEL_MODULES: Set[str] = {"i915"}
+_MODULE_NAME = re.compile(r"^\S+", re.MULTILINE)  # First column of each /proc/modules line
 
 # --- Package Manager Definitions ---
 PACKAGE_MANAGERS: Dict[str, List[str]] = {
@@ -51,6 +73,22 @@ PACKAGE_MANAGERS: Dict[str, List[str]] = {
     "pacman": ["pacman", "-Q"],
     "zypper": ["zypper", "se", "-i"],
 }
+PACKAGE_SCAN_TIMEOUT: int = 5  # Seconds before a package listing is abandoned
+
+# --- Distribution to Package Manager Mapping ---
+# Matched against the ID and ID_LIKE fields of /etc/os-release
+OS_RELEASE: Path = Path("/etc/os-release")
+DISTRO_PACKAGE_MANAGERS: Dict[str, str] = {
+    "debian": "dpkg",
+    "ubuntu": "dpkg",
+    "fedora": "rpm",
+    "rhel": "rpm",
+    "centos": "rpm",
+    "arch": "pacman",
+    "opensuse": "zypper",  # Also covers opensuse-leap, opensuse-tumbleweed, ...
+    "suse": "zypper",
+    "sles": "zypper",
+}
 
 # --- Package Name Patterns (as Regex) ---
 NVIDIA_PACKAGE_PATTERNS: Dict[str, str] = {
@@ -67,12 +105,49 @@ INTEL_PACKAGE_PATTERNS: Dict[str, str] = {
     "zypper": r"libva-intel-driver|xorg-x11-drv-intel",
 }
 
+# --- Package Manager Table ---
+# One (name, argv, pattern) entry per package manager, built once so the scan
+# loop needs no dict lookups or argv rebuilding. The pattern has a named group
+# per vendor, so a single pass over the listing classifies every vendor at once,
+# and is compiled as bytes to match the raw, undecoded command output.
+VENDOR_PACKAGE_PATTERNS: Dict[str, Dict[str, str]] = {
+    "nvidia": NVIDIA_PACKAGE_PATTERNS,
+    "intel": INTEL_PACKAGE_PATTERNS,
+}
+
+PackageManagerEntry = Tuple[str, Tuple[str, ...], "re.Pattern[bytes]"]
+
+_PM_TABLE: Tuple[PackageManagerEntry, ...] = tuple(
+    (
+        pm,
+        tuple(argv),
+        re.compile(
+            "|".join(f"(?P<{vendor}>{patterns[pm]})" for vendor, patterns in VENDOR_PACKAGE_PATTERNS.items()).encode(),
+            re.IGNORECASE,
+        ),
+    )
+    for pm, argv in PACKAGE_MANAGERS.items()
+)
+
 # --- PCI Vendor IDs ---
 VENDOR_IDS: Dict[str, str] = {
     "intel": "0x8086",
     "nvidia": "0x10de",
 }
 
+# --- PCI Sysfs Paths ---
+SYSFS_PCI_DEVICES: Path = Path("/sys/bus/pci/devices")
+PCI_DISPLAY_CLASS_PREFIX: str = "0x03"  # PCI base class 0x03: display controller
+
+# --- libpci (pciutils) ---
+LIBPCI_NAME: str = "libpci.so.3"
+# libpci's Linux access methods. libpci's default error handler calls exit(), so
+# pci_init() must only run when one of them can be listed and entered
+LIBPCI_ACCESS_PATHS: Tuple[Path, ...] = (SYSFS_PCI_DEVICES, Path("/proc/bus/pci"))
+PCI_FILL_IDENT: int = 0x0001
+PCI_FILL_CLASS: int = 0x0020
+PCI_DISPLAY_BASE_CLASS: int = 0x03
+
 # -------------------- Color Utilities --------------------
 
 def colorize(text: str, color: str) -> str:
@@ -101,82 +176,378 @@ def status_title(text: str) -> str:
 
 # -------------------- Utility Functions --------------------
 
+@functools.lru_cache(maxsize=None)
 def is_command_available(cmd: str) -> bool:
-    """Check if a system command is available in PATH."""
+    """Check if a system command is available in PATH. Results are memoized."""
     return shutil.which(cmd) is not None
 
-def run_command(command: List[str], timeout: int = 5) -> Optional[str]:
+# Outputs of commands already run, keyed by argv, so repeated checks share a
+# single run of each command.
+_command_output_cache: Dict[Tuple[str, ...], Optional[bytes]] = {}
+
+def run_command(command: Sequence[str], timeout: int = 5) -> Optional[bytes]:
     """
-    Run a system command and return its stdout, or None on failure.
+    Run a system command and return its raw stdout, or None on failure.
+    stdout is not decoded and stderr is discarded, since callers only search stdout.
+    Results are cached per argv, so each command is only spawned once.
     Logs errors and timeouts.
     """
+    key = tuple(command)
+    if key not in _command_output_cache:
+        _command_output_cache[key] = _execute_command(command, timeout)
+    return _command_output_cache[key]
+
+def _execute_command(command: Sequence[str], timeout: int) -> Optional[bytes]:
+    """
+    Spawn a system command and return its stdout, or None on failure.
+    The argv list is executed directly, never through a shell.
+    """
     try:
         result = subprocess.run(
             command,
-            capture_output=True,
-            text=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             timeout=timeout,
             check=False  # We check the returncode manually
         )
         if result.returncode == 0:
-            return result.stdout.strip()
+            return result.stdout
         else:
-            logging.debug(
-                f"Command '{' '.join(command)}' failed with code {result.returncode}: {result.stderr.strip()}"
-            )
+            logging.debug("Command %r failed with code %d", command, result.returncode)
     except FileNotFoundError:
-        logging.error(f"Command not found: {command[0]}")
+        logging.error("Command not found: %s", command[0])
     except subprocess.TimeoutExpired:
-        logging.warning(f"Command timed out: {' '.join(command)}")
+        logging.warning("Command timed out: %r", command)
     except Exception as e:
-        logging.error(f"Error running command '{' '.join(command)}': {e}")
+        logging.error("Error running command %r: %s", command, e)
     return None
 
-def check_required_commands(commands: Set[str]) -> bool:
-    """Ensure all required system commands are available."""
-    missing = {cmd for cmd in commands if not is_command_available(cmd)}
+def run_command_lines(command: Sequence[str], timeout: int = 5) -> Iterator[bytes]:
+    """
+    Run a system command and yield its raw stdout line by line, without buffering
+    the whole output. Closing the generator early terminates the process.
+    Lines are yielded as they arrive, so output of a command that later fails is
+    not discarded. The command runs in its own session so that on timeout or early
+    close its whole process group is signalled, including any grandchildren still
+    holding the stdout pipe open. Logs errors and timeouts.
+    """
+    try:
+        process = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, start_new_session=True
+        )
+    except FileNotFoundError:
+        logging.error("Command not found: %s", command[0])
+        return
+    except Exception as e:
+        logging.error("Error running command %r: %s", command, e)
+        return
+
+    def signal_group(sig: signal.Signals) -> None:
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass  # Whole group already exited
+
+    timed_out = threading.Event()
+    def kill_on_timeout() -> None:
+        timed_out.set()
+        signal_group(signal.SIGKILL)
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.start()
+
+    finished = False
+    try:
+        yield from process.stdout
+        finished = True
+    finally:
+        timer.cancel()
+        if not finished:
+            signal_group(signal.SIGTERM)  # Caller stopped reading early
+        process.stdout.close()
+        process.wait()
+
+    if timed_out.is_set():
+        logging.warning("Command timed out: %r", command)
+    elif process.returncode != 0:
+        logging.debug("Command %r failed with code %d", command, process.returncode)
+
+def check_required_files(paths: Set[Path]) -> bool:
+    """Ensure all required system files exist."""
+    missing = {path for path in paths if not path.exists()}
     if missing:
-        for cmd in sorted(missing):
-            logging.error(f"Missing required system utility: {cmd}")
+        for path in sorted(missing):
+            logging.error("Missing required system file: %s", path)
         return False
     return True
 
+def detect_active_package_manager() -> Optional[str]:
+    """
+    Determine the distribution's package manager from /etc/os-release.
+    Returns None if the file is unreadable or the distribution is unknown.
+    """
+    try:
+        os_release = OS_RELEASE.read_text()
+    except OSError:
+        return None
+
+    fields: Dict[str, str] = {}
+    for line in os_release.splitlines():
+        key, sep, value = line.partition("=")
+        if sep:
+            fields[key.strip()] = value.strip().strip("\"'")
+
+    # ID takes precedence over the more generic ID_LIKE entries
+    for distro in [fields.get("ID", ""), *fields.get("ID_LIKE", "").split()]:
+        if pm := DISTRO_PACKAGE_MANAGERS.get(distro.split("-")[0].lower()):
+            return pm
+    return None
+
+# Resolved once at import; None means every available package manager is probed
+ACTIVE_PM: Optional[str] = detect_active_package_manager()
+_ACTIVE_PM_TABLE: Tuple[PackageManagerEntry, ...] = tuple(entry for entry in _PM_TABLE if entry[0] == ACTIVE_PM)
+
+def get_package_managers() -> Tuple[PackageManagerEntry, ...]:
+    """
+    Return the package manager table entries to query.
+    Only ACTIVE_PM when it is known and in PATH, otherwise every one found in PATH.
+    """
+    if _ACTIVE_PM_TABLE and is_command_available(_ACTIVE_PM_TABLE[0][1][0]):
+        return _ACTIVE_PM_TABLE
+    return tuple(entry for entry in _PM_TABLE if is_command_available(entry[1][0]))
+
+# -------------------- libpci Bindings --------------------
+
+class PciDev(ctypes.Structure):
+    """Leading fields of libpci's struct pci_dev, stable since pciutils 3.0."""
+
+PciDev._fields_ = [
+    ("next", ctypes.POINTER(PciDev)),
+    ("domain_16", ctypes.c_uint16),
+    ("bus", ctypes.c_uint8),
+    ("dev", ctypes.c_uint8),
+    ("func", ctypes.c_uint8),
+    ("known_fields", ctypes.c_uint),
+    ("vendor_id", ctypes.c_uint16),
+    ("device_id", ctypes.c_uint16),
+    ("device_class", ctypes.c_uint16),
+]
+
+class PciAccess(ctypes.Structure):
+    """Leading fields of libpci's struct pci_access, up to the device list."""
+    _fields_ = [
+        ("method", ctypes.c_uint),
+        ("writeable", ctypes.c_int),
+        ("buscentric", ctypes.c_int),
+        ("id_file_name", ctypes.c_char_p),
+        ("free_id_name", ctypes.c_int),
+        ("numeric_ids", ctypes.c_int),
+        ("lookup_mode", ctypes.c_uint),
+        ("debugging", ctypes.c_int),
+        ("error", ctypes.c_void_p),
+        ("warning", ctypes.c_void_p),
+        ("debug", ctypes.c_void_p),
+        ("devices", ctypes.POINTER(PciDev)),
+    ]
+
+def _libpci_names() -> Iterator[str]:
+    """Yield the names to load libpci by, searching the linker cache only if needed."""
+    yield LIBPCI_NAME
+    import ctypes.util  # Slow to import and find_library() runs ldconfig, so only on a miss
+    if name := ctypes.util.find_library("pci"):
+        yield name
+
+@functools.lru_cache(maxsize=None)
+def load_libpci() -> Optional[ctypes.CDLL]:
+    """Load libpci and declare the functions used, or return None if it is not installed."""
+    for name in _libpci_names():
+        try:
+            libpci = ctypes.CDLL(name)
+        except OSError:
+            continue
+        libpci.pci_alloc.restype = ctypes.POINTER(PciAccess)
+        libpci.pci_alloc.argtypes = []
+        libpci.pci_init.restype = None
+        libpci.pci_init.argtypes = [ctypes.POINTER(PciAccess)]
+        libpci.pci_scan_bus.restype = None
+        libpci.pci_scan_bus.argtypes = [ctypes.POINTER(PciAccess)]
+        libpci.pci_fill_info.restype = ctypes.c_int
+        libpci.pci_fill_info.argtypes = [ctypes.POINTER(PciDev), ctypes.c_int]
+        libpci.pci_cleanup.restype = None
+        libpci.pci_cleanup.argtypes = [ctypes.POINTER(PciAccess)]
+        return libpci
+    logging.debug("libpci not found")
+    return None
+
+def libpci_usable() -> bool:
+    """
+    Return whether libpci is installed and has an access method to use.
+    The access paths are checked first so libpci is never loaded needlessly.
+    """
+    readable = any(os.access(path, os.R_OK | os.X_OK) for path in LIBPCI_ACCESS_PATHS)
+    return readable and load_libpci() is not None
+
 # -------------------- GPU Detection & Driver Checks --------------------
 
-def detect_gpus() -> Dict[str, bool]:
+def detect_gpus(thorough: bool = False) -> Dict[str, bool]:
     """
-    Detect presence of NVIDIA and Intel GPUs using available system utilities.
+    Detect presence of NVIDIA and Intel GPUs.
+    Reads PCI IDs in-process through libpci, then sysfs, falling back to
+    system utilities if neither is usable.
     Returns a dict mapping vendor name to a boolean.
     """
+    if (gpus := detect_gpus_libpci()) is not None:
+        return gpus
+    if (gpus := detect_gpus_sysfs()) is not None:
+        return gpus
+    return detect_gpus_commands(thorough)
+
+def detect_gpus_libpci() -> Optional[Dict[str, bool]]:
+    """
+    Detect GPUs by scanning the PCI bus in-process through libpci.
+    Returns None if libpci is not installed or has no access method.
+    """
+    if not libpci_usable():
+        return None
+    libpci = load_libpci()
+    if not (access := libpci.pci_alloc()):
+        return None
+
+    vendors_by_id = {int(vendor_id, 16): vendor for vendor, vendor_id in VENDOR_IDS.items()}
+    gpus: Dict[str, bool] = {vendor: False for vendor in VENDOR_IDS}
+    try:
+        libpci.pci_init(access)
+        libpci.pci_scan_bus(access)
+        device = access.contents.devices
+        while device:
+            known = libpci.pci_fill_info(device, PCI_FILL_IDENT | PCI_FILL_CLASS)
+            dev = device.contents
+            if known & PCI_FILL_CLASS and dev.device_class >> 8 == PCI_DISPLAY_BASE_CLASS:
+                if vendor := vendors_by_id.get(dev.vendor_id):
+                    gpus[vendor] = True
+            device = dev.next
+    finally:
+        libpci.pci_cleanup(access)
+    return gpus
+
+def detect_gpus_sysfs() -> Optional[Dict[str, bool]]:
+    """
+    Detect GPUs by reading PCI vendor and class IDs from sysfs.
+    Returns None if sysfs cannot be read.
+    """
+    vendors_by_id = {vendor_id: vendor for vendor, vendor_id in VENDOR_IDS.items()}
+    gpus: Dict[str, bool] = {vendor: False for vendor in VENDOR_IDS}
+    try:
+        for device in SYSFS_PCI_DEVICES.iterdir():
+            if not (device / "class").read_text().startswith(PCI_DISPLAY_CLASS_PREFIX):
+                continue
+            if vendor := vendors_by_id.get((device / "vendor").read_text().strip()):
+                gpus[vendor] = True
+    except OSError as e:
+        logging.debug("Could not read PCI devices from %s: %s", SYSFS_PCI_DEVICES, e)
+        return None
+    return gpus
+
+@functools.lru_cache(maxsize=None)
+def get_gpu_detection_commands(thorough: bool = False) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Return the available GPU detection commands, including the slow ones if thorough.
+    Filtered against PATH once and memoized.
+    """
+    commands = GPU_DETECTION_COMMANDS + THOROUGH_GPU_DETECTION_COMMANDS if thorough else GPU_DETECTION_COMMANDS
+    return tuple(cmd for cmd in commands if is_command_available(cmd[0]))
+
+def find_vendor_names(output: bytes) -> Set[str]:
+    """Return the GPU vendor names mentioned anywhere in a utility's output."""
+    lowered = output.lower()
+    return {vendor for vendor in VENDOR_IDS if vendor.encode() in lowered}
+
+def detect_gpus_commands(thorough: bool = False) -> Dict[str, bool]:
+    """
+    Detect GPUs by searching the output of available system utilities.
+    Stops as soon as an authoritative utility such as lspci reports a vendor.
+    """
     gpus: Dict[str, bool] = {"nvidia": False, "intel": False}
-    for cmd in GPU_DETECTION_COMMANDS:
-        if not is_command_available(cmd[0]):
-            continue
+    for cmd in get_gpu_detection_commands(thorough):
         if output := run_command(cmd):
-            out_lower = output.lower()
-            if "nvidia" in out_lower:
-                gpus["nvidia"] = True
-            if "intel" in out_lower:
-                gpus["intel"] = True
+            for vendor in find_vendor_names(output):
+                gpus[vendor] = True
             if all(gpus.values()):
                 break  # Stop early if all are found
+            if cmd[0] in AUTHORITATIVE_GPU_DETECTION_COMMANDS and any(gpus.values()):
+                break  # Trust its answer for the remaining vendors too
     return gpus
 
 def get_loaded_kernel_modules() -> Set[str]:
     """Get a set of currently loaded kernel module names."""
-    if not (modules_output := run_command(["lsmod"])):
+    try:
+        modules_output = PROC_MODULES.read_text()
+    except OSError as e:
+        logging.error("Could not read %s: %s", PROC_MODULES, e)
         return set()
-    return {line.split()[0] for line in modules_output.splitlines()[1:] if line}
+    # Pull the first column straight out of the file instead of building per-line lists
+    return {match.group() for match in _MODULE_NAME.finditer(modules_output)}
 
-def check_packages(patterns: Dict[str, str]) -> List[str]:
-    """Check for installed packages matching given regex patterns."""
-    found_via = []
-    for pm, cmd in PACKAGE_MANAGERS.items():
-        if not is_command_available(cmd[0]):
-            continue
-        if (output := run_command(cmd)) and re.search(patterns[pm], output, re.IGNORECASE):
-            found_via.append(f"Found via {pm}")
-    return found_via
+# Streaming package listing scans, keyed by package manager name. Each runs at
+# most once per process, so a finished scan's result is never recomputed.
+_package_scans: Dict[str, "PackageScan"] = {}
+
+class PackageScan:
+    """
+    Streaming scan of one package manager's listing in a background thread.
+    Each vendor's event is set on its first matching package, and every event
+    is set once the listing ends, so a set event means the vendor is resolved.
+    The listing is read until every vendor is found or it ends.
+    """
+
+    def __init__(self, argv: Sequence[str], pattern: "re.Pattern[bytes]") -> None:
+        self.found: Set[str] = set()
+        self.resolved: Dict[str, threading.Event] = {vendor: threading.Event() for vendor in VENDOR_PACKAGE_PATTERNS}
+        threading.Thread(target=self._run, args=(argv, pattern), daemon=True).start()
+
+    def _run(self, argv: Sequence[str], pattern: "re.Pattern[bytes]") -> None:
+        """Worker: stream the listing, publishing each vendor's first hit."""
+        try:
+            with closing(run_command_lines(argv, PACKAGE_SCAN_TIMEOUT)) as lines:
+                for line in lines:
+                    match = pattern.search(line)
+                    if match and match.lastgroup not in self.found:
+                        self.found.add(match.lastgroup)
+                        self.resolved[match.lastgroup].set()
+                        if len(self.found) == len(self.resolved):
+                            break  # Nothing left to look for
+        finally:
+            for event in self.resolved.values():
+                event.set()
+
+    def has_vendor(self, vendor: str) -> bool:
+        """Wait until the vendor is resolved and return whether a package matched."""
+        self.resolved[vendor].wait(PACKAGE_SCAN_TIMEOUT)
+        return vendor in self.found
+
+def start_package_scans() -> List[Tuple[str, PackageScan]]:
+    """
+    Start a scan of every package manager in use, unless already started.
+    Returns (name, scan) pairs in table order.
+    """
+    scans: List[Tuple[str, PackageScan]] = []
+    for pm, argv, pattern in get_package_managers():
+        if pm not in _package_scans:
+            _package_scans[pm] = PackageScan(argv, pattern)
+        scans.append((pm, _package_scans[pm]))
+    return scans
+
+def check_packages(vendor: str, first_match_only: bool = True) -> List[str]:
+    """
+    Check for installed packages belonging to the given GPU vendor.
+    With first_match_only, stops at the first package manager, in table order, with a match.
+    """
+    found: List[str] = []
+    for pm, scan in start_package_scans():
+        if scan.has_vendor(vendor):
+            found.append(f"Found via {pm}")
+            if first_match_only:
+                break
+    return found
 
 def check_nvidia_driver(loaded_modules: Set[str]) -> Dict[str, Any]:
     """Check for NVIDIA driver installation and status."""
@@ -190,14 +561,15 @@ def check_nvidia_driver(loaded_modules: Set[str]) -> Dict[str, Any]:
     elif found_nouveau:
         info.update({"installed": True, "type": "nouveau (open-source)", "modules_loaded": sorted(found_nouveau)})
 
-    # nvidia-smi is a definitive sign of the proprietary driver
-    if is_command_available("nvidia-smi") and run_command(["nvidia-smi"]):
+    # nvidia-smi is a definitive sign of the proprietary driver; only needed
+    # when the loaded modules have not already proven it
+    if not found_proprietary and is_command_available("nvidia-smi") and run_command(["nvidia-smi"]):
         info["installed"] = True
         info["type"] = "proprietary NVIDIA"
 
     # If no modules are loaded, check for installed packages as a fallback
     if not info["installed"]:
-        if packages := check_packages(NVIDIA_PACKAGE_PATTERNS):
+        if packages := check_packages("nvidia"):
             info.update({"installed": True, "type": "proprietary NVIDIA (inactive)", "packages": packages})
     return info
 
@@ -210,7 +582,7 @@ def check_intel_driver(loaded_modules: Set[str]) -> Dict[str, Any]:
         info.update({"installed": True, "modules_loaded": sorted(found_modules)})
 
     # Corroborate with package checks or use them as a fallback
-    if packages := check_packages(INTEL_PACKAGE_PATTERNS):
+    if packages := check_packages("intel"):
         info["installed"] = True
         info["packages"] = packages
     
@@ -240,19 +612,36 @@ def print_results(gpu_detected: bool, driver_info: Dict[str, Any], gpu_type: str
         print(f"{status_err('Driver Status:')} No active {gpu_name} driver detected.")
         print(status_warn("  -> Consider installing the appropriate drivers for your distribution."))
 
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(description="Detect NVIDIA and Intel GPUs and check their drivers.")
+    parser.add_argument(
+        "--thorough",
+        action="store_true",
+        help="also query glxinfo when neither libpci nor sysfs can be used (slow: starts an X/GL connection)",
+    )
+    return parser.parse_args()
+
 def main() -> None:
     """Main entry point for GPU driver detection."""
+    args = parse_args()
     print(status_title("\nLinux GPU & Driver Detection Utility"))
     print("=" * 40)
 
-    if not check_required_commands(REQUIRED_COMMANDS):
-        print(status_err("\nAborting: Missing one or more required system utilities."))
+    if not check_required_files(REQUIRED_FILES):
+        print(status_err("\nAborting: Missing one or more required system files."))
         sys.exit(1)
 
     # Perform detection once to avoid redundant calls
-    gpus_found = detect_gpus()
+    gpus_found = detect_gpus(args.thorough)
     loaded_modules = get_loaded_kernel_modules()
     any_gpu_processed = False
+
+    # The Intel check always consults packages, so start the scans in the
+    # background now. Otherwise they are only started if the NVIDIA check
+    # finds modules and nvidia-smi inconclusive.
+    if gpus_found.get("intel"):
+        start_package_scans()
     print()
 
     # --- Vendor-specific checks ---
@@ -270,7 +659,7 @@ def main() -> None:
 
     if not any_gpu_processed:
         print(status_warn("Warning: Could not detect any supported GPU hardware (NVIDIA, Intel)."))
-        print(status_info("This may be due to missing optional utilities (lshw, glxinfo) or an unsupported GPU."))
+        print(status_info("This may be due to missing optional utilities (lspci, lshw, glxinfo) or an unsupported GPU."))
 
 if __name__ == "__main__":
     main()